@@ -2,11 +2,15 @@
 # Imports
 # -----------------------------------------
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left, bisect_right
+import asyncio
 import logging
+import mmap
 import os
-from typing import List
+import re
+from typing import Callable, List, Optional
 
 # -----------------------------------------
 # Logger Setup
@@ -14,6 +18,171 @@ from typing import List
 
 logger = logging.getLogger(__name__)
 
+# -----------------------------------------
+# Constants
+# -----------------------------------------
+
+SMALL_FILE_SIZE = 64 * 1024         # Files up to this size are read with a single read call
+
+# Candidate split points: paragraph breaks, line breaks, sentence ends, commas and whitespace
+DEFAULT_SEPARATORS = [r"\n\n", r"\n", r"(?<=[.!?])\s", ",", r"\s"]
+
+# -----------------------------------------
+# Helper Functions
+# -----------------------------------------
+
+def _normalize_newlines(text: str) -> str:
+    """
+    Convert CRLF and CR line endings to LF, as text-mode file reads do.
+
+    Args:
+        text (str): The decoded text.
+
+    Returns:
+        str: The text with LF line endings only.
+    """
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+# -----------------------------------------
+# FastTextSplitter Class Definition
+# -----------------------------------------
+
+class FastTextSplitter:
+    """
+    Single-pass text splitter that finds all candidate split points with one compiled regex
+    and greedily packs the text between them into overlapping chunks, preferring the
+    separators in their priority order.
+
+    Attributes:
+        chunk_size (int): Maximum size of each text chunk.
+        chunk_overlap (int): Maximum overlap between consecutive chunks.
+        separators (List[str]): Regex patterns of the candidate split points, highest priority first.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        separators: Optional[List[str]] = None
+    ):
+        """
+        Initialize the FastTextSplitter.
+
+        Args:
+            chunk_size (int): Maximum size of each text chunk.
+            chunk_overlap (int): Maximum overlap between consecutive chunks.
+            separators (Optional[List[str]]): Regex patterns of the candidate split points,
+                highest priority first. Patterns must not contain capturing groups.
+                Defaults to DEFAULT_SEPARATORS.
+        """
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = separators or DEFAULT_SEPARATORS
+
+        # Compile all separators into a single alternation once, not per split_text call.
+        # Each separator gets its own named group so a match tells us its priority level.
+        self._boundary_re = re.compile("|".join(
+            f"(?P<sep{level}>{sep})" for level, sep in enumerate(self.separators)
+        ))
+
+        # Boundary offsets per priority level, reused across split_text calls
+        self._offsets: List[List[int]] = [[] for _ in self.separators]
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split documents into chunks, copying each document's metadata onto its chunks.
+
+        Args:
+            documents (List[Document]): The documents to split.
+
+        Returns:
+            List[Document]: The split chunks.
+        """
+        return [
+            Document(page_content=chunk, metadata=dict(doc.metadata))
+            for doc in documents
+            for chunk in self.split_text(doc.page_content)
+        ]
+
+    def split_text(self, text: str) -> List[str]:
+        """
+        Split a text into chunks of at most chunk_size characters.
+
+        Each chunk ends at the last boundary of the highest-priority separator that fits
+        in the window, falling back to lower-priority separators (and finally a hard cut)
+        only when no such boundary exists.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            List[str]: The text chunks.
+        """
+        # Boundaries are offsets just after each separator match, grouped by priority level.
+        # Candidates are never sliced out of the text; only the emitted chunks are.
+        offsets = self._offsets
+        for level_offsets in offsets:
+            level_offsets.clear()
+        for match in self._boundary_re.finditer(text):
+            offsets[int(match.lastgroup[3:])].append(match.end())
+
+        chunks = []
+        start = 0
+        end = 0
+        while start < len(text):
+            limit = start + self.chunk_size
+            if limit >= len(text):
+                end = len(text)
+            else:
+                # Only consider boundaries past the previous chunk's end, so each chunk adds new text
+                end = self._last_boundary(max(start, end), limit) or limit
+
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+            if end >= len(text):
+                break
+
+            # Start the next chunk at a boundary inside the overlap window, if there is one
+            next_start = self._first_boundary(max(end - self.chunk_overlap, start + 1), end)
+            start = next_start or end
+
+        return chunks
+
+    def _last_boundary(self, start: int, limit: int) -> Optional[int]:
+        """
+        Find the last boundary in (start, limit] of the highest-priority level that has one.
+
+        Args:
+            start (int): The offset where the chunk starts.
+            limit (int): The largest allowed end offset.
+
+        Returns:
+            Optional[int]: The boundary offset, or None if there is no boundary in the window.
+        """
+        for level_offsets in self._offsets:
+            i = bisect_right(level_offsets, limit) - 1
+            if i >= 0 and level_offsets[i] > start:
+                return level_offsets[i]
+        return None
+
+    def _first_boundary(self, low: int, end: int) -> Optional[int]:
+        """
+        Find the first boundary in [low, end) of the highest-priority level that has one.
+
+        Args:
+            low (int): The smallest allowed start offset.
+            end (int): The offset where the previous chunk ended.
+
+        Returns:
+            Optional[int]: The boundary offset, or None if there is no boundary in the window.
+        """
+        for level_offsets in self._offsets:
+            i = bisect_left(level_offsets, low)
+            if i < len(level_offsets) and level_offsets[i] < end:
+                return level_offsets[i]
+        return None
+
 # -----------------------------------------
 # DocumentProcessor Class Definition
 # -----------------------------------------
@@ -34,18 +203,21 @@ class DocumentProcessor:
         self.directory_path = directory_path
 
         # Initialize the text splitter with specified parameters
-        self.text_splitter = RecursiveCharacterTextSplitter(
+        self.text_splitter = FastTextSplitter(
             chunk_size=1000,          # Maximum size of each text chunk
             chunk_overlap=200,        # Overlap between chunks to maintain context
-            length_function=len,      # Function to measure the length of text
-            separators=["\n\n", "\n", ".", "!", "?", ",", " "]  # Preferred points to split text
+            separators=DEFAULT_SEPARATORS  # Preferred points to split text, highest priority first
         )
 
-    def load_and_split_documents(self) -> List[Document]:
+    def load_and_split_documents(self, progress_cb: Optional[Callable[[int, int], None]] = None) -> List[Document]:
         """
         Load text documents from the directory, split them into chunks,
         and return a list of Document objects.
 
+        Args:
+            progress_cb (Optional[Callable[[int, int], None]]): Called with (files done, total files)
+                after each file has been read.
+
         Returns:
             List[Document]: A list of Document objects containing the split text chunks.
 
@@ -53,50 +225,20 @@ class DocumentProcessor:
             ValueError: If the directory does not exist or no valid documents are found.
         """
         try:
-            documents = []
-
             # Ensure the directory exists
             if not os.path.exists(self.directory_path):
                 raise ValueError(f"Directory not found: {self.directory_path}")
 
-            # Iterate over all files in the directory
-            for filename in os.listdir(self.directory_path):
-                # Process only .txt files
-                if filename.endswith('.txt'):
-                    file_path = os.path.join(self.directory_path, filename)
-                    logger.info(f"Processing file: {file_path}")
-
-                    try:
-                        # Open and read the content of the file
-                        with open(file_path, 'r', encoding='utf-8') as file:
-                            text = file.read()
-
-                            # Check if the file is not empty
-                            if text.strip():
-                                # Create a Document object with the text content and metadata
-                                doc = Document(
-                                    page_content=text,
-                                    metadata={"source": filename}
-                                )
-
-                                # Split the document into smaller chunks
-                                split_docs = self.text_splitter.split_documents([doc])
-
-                                # Add the split documents to the list
-                                documents.extend(split_docs)
-                                logger.info(f"Successfully processed {filename}")
-                            else:
-                                # Log a warning if the file is empty
-                                logger.warning(f"Empty file: {file_path}")
-                    except Exception as e:
-                        # Log any exceptions that occur while processing a file
-                        logger.error(f"Error processing file {file_path}: {str(e)}")
-                        continue  # Skip to the next file
-
-            # Raise an error if no documents were processed successfully
-            if not documents:
+            # Read the files concurrently
+            docs = asyncio.run(self._aload(progress_cb))
+
+            # Raise an error if no documents were loaded successfully
+            if not docs:
                 raise ValueError("No valid documents found or all documents were empty")
 
+            # Split all documents into smaller chunks in a single call
+            documents = self.text_splitter.split_documents(docs)
+
             logger.info(f"Successfully processed {len(documents)} document chunks")
             return documents
 
@@ -104,3 +246,103 @@ class DocumentProcessor:
             # Log any exceptions that occur during the document loading and splitting process
             logger.error(f"Error in load_and_split_documents: {str(e)}")
             raise
+
+    async def _aload(self, progress_cb: Optional[Callable[[int, int], None]] = None) -> List[Document]:
+        """
+        Read all .txt files in the directory concurrently.
+
+        Args:
+            progress_cb (Optional[Callable[[int, int], None]]): Called with (files done, total files)
+                after each file has been read.
+
+        Returns:
+            List[Document]: The unsplit documents of all files.
+        """
+        # Scan the directory once; scandir entries carry the file type without extra stat calls
+        with os.scandir(self.directory_path) as entries:
+            file_paths = [
+                entry.path for entry in entries
+                if entry.is_file() and entry.name.endswith('.txt')
+            ]
+
+        loop = asyncio.get_running_loop()
+        done = 0
+
+        async def load(file_path: str) -> List[Document]:
+            nonlocal done
+            docs = await loop.run_in_executor(executor, self._load_one, file_path)
+
+            # Report progress from the event loop, i.e. in the caller's thread
+            done += 1
+            if progress_cb:
+                progress_cb(done, len(file_paths))
+            return docs
+
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            results = await asyncio.gather(*[load(file_path) for file_path in file_paths])
+
+        return [doc for file_docs in results for doc in file_docs]
+
+    def _load_one(self, file_path: str) -> List[Document]:
+        """
+        Read a single text file into an unsplit Document.
+
+        Args:
+            file_path (str): The path to the .txt file.
+
+        Returns:
+            List[Document]: The document, or an empty list if the file is empty or unreadable.
+        """
+        filename = os.path.basename(file_path)
+        logger.info(f"Processing file: {file_path}")
+
+        try:
+            text = self._read_text(file_path)
+
+            # Check if the file is not empty
+            if not text.strip():
+                # Log a warning if the file is empty
+                logger.warning(f"Empty file: {file_path}")
+                return []
+
+            # Create a Document object with the text content and metadata
+            doc = Document(
+                page_content=text,
+                metadata={"source": filename}
+            )
+            logger.info(f"Successfully processed {filename}")
+            return [doc]
+
+        except Exception as e:
+            # Log any exceptions that occur while processing a file
+            logger.error(f"Error processing file {file_path}: {str(e)}")
+            return []  # Skip to the next file
+
+    def _read_text(self, file_path: str) -> str:
+        """
+        Decode a text file as UTF-8, converting line endings to LF like a text-mode read.
+
+        The file is opened once; files up to SMALL_FILE_SIZE are read with a single read
+        call, larger files are decoded straight from a memory map.
+
+        Args:
+            file_path (str): The path to the .txt file.
+
+        Returns:
+            str: The decoded text.
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return ""  # Empty files cannot be memory-mapped
+
+            if size <= SMALL_FILE_SIZE:
+                # A single read is cheaper than setting up (and faulting in) a mapping
+                return _normalize_newlines(os.read(fd, size).decode('utf-8', errors='replace'))
+
+            # Decode straight from the mapped pages, without an intermediate bytes copy
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _normalize_newlines(str(view, 'utf-8', errors='replace'))
+        finally:
+            os.close(fd)
@@ -5,8 +5,16 @@
 
 from langchain_community.embeddings import SentenceTransformerEmbeddings
 from langchain_community.vectorstores import Chroma
+from transformers import AutoTokenizer, PreTrainedTokenizerFast
+from contextlib import closing
+import hashlib
 import logging
+import numpy as np
 import os
+import sqlite3
+import torch
+import uuid
+from typing import List, Literal, Optional
 
 # -----------------------------------------
 # Logger Setup
@@ -14,6 +22,30 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# -----------------------------------------
+# Torch Thread Setup
+# -----------------------------------------
+
+# Use every available core for intra-op parallelism in the encoder
+_cpu_count = os.cpu_count() or 1
+torch.set_num_threads(_cpu_count)
+try:
+    torch.set_num_interop_threads(max(2, _cpu_count // 2))
+except RuntimeError:
+    # Inter-op threads can only be set once, before any parallel work has started
+    logger.debug("Torch inter-op thread count already initialized")
+
+# -----------------------------------------
+# Constants
+# -----------------------------------------
+
+CACHE_QUERY_BATCH_SIZE = 900  # Stay below SQLite's limit on bound parameters per statement
+CHROMA_INSERT_BATCH_SIZE = 5000  # Documents per Chroma add() call
+
+# Chroma fixes a collection's distance function when its index is created, so cosine
+# vectors go to their own collection instead of the existing (L2) "langchain" collection
+CHROMA_COLLECTION_NAME = "langchain_cosine"
+
 # -----------------------------------------
 # EmbeddingsManager Class Definition
 # -----------------------------------------
@@ -27,24 +59,128 @@ class EmbeddingsManager:
         embeddings: The embeddings model used to generate document embeddings.
     """
 
-    def __init__(self, persist_directory: str):
+    def __init__(
+        self,
+        persist_directory: str,
+        quantize: bool = True,
+        use_onnx: bool = False,
+        backend: Literal["chroma", "pgvector", "faiss"] = "chroma",
+        connection: Optional[str] = None,
+        compile_model: bool = False
+    ):
         """
         Initialize the EmbeddingsManager with a directory for persistence.
 
         Args:
             persist_directory (str): The path to the directory for storing embeddings and models.
+            quantize (bool): Whether to dynamically quantize the encoder's linear layers to int8.
+            use_onnx (bool): Whether to run the encoder through ONNX Runtime instead of PyTorch.
+            backend (str): The vector store backend: "chroma", "pgvector" or "faiss".
+            connection (Optional[str]): The PostgreSQL connection string (pgvector backend only).
+            compile_model (bool): Whether to compile the PyTorch encoder with torch.compile
+                (ignored, with a warning, when quantize is True).
+
+        Raises:
+            ValueError: If the backend is unknown or pgvector is used without a connection string.
         """
+        if backend not in ("chroma", "pgvector", "faiss"):
+            raise ValueError(f"Unknown vector store backend: {backend}")
+        if backend == "pgvector" and not connection:
+            raise ValueError("A connection string is required for the pgvector backend")
+
         self.persist_directory = persist_directory
+        self.use_onnx = use_onnx
+        self.backend = backend
+        self.connection = connection
+        self.cache_path = os.path.join(persist_directory, "emb_cache.db")
+
+        self._cache_tag = self._cache_tag_for(quantize, use_onnx)
 
         # Ensure the persistence directory exists
         os.makedirs(persist_directory, exist_ok=True)
 
+        if use_onnx:
+            # Imported lazily so optimum/onnxruntime are only required for the ONNX path
+            from pysrc.onnx_embeddings import OnnxEmbeddings
+
+            # Initialize the embeddings model from an ONNX export of the same checkpoint
+            self.embeddings = OnnxEmbeddings(
+                model_name="sentence-transformers/all-MiniLM-L6-v2",
+                export_directory=os.path.join(self.persist_directory, "onnx"),
+                cache_folder=os.path.join(self.persist_directory, "models")  # Same cache as the PyTorch path
+            )
+        else:
+            self.embeddings = self._load_sentence_transformer(quantize)
+
+            # Compile the transformer forward pass; the warmup below triggers the compilation.
+            # Dynamic shapes avoid recompiling for every new batch size and sequence length.
+            if compile_model and quantize:
+                logger.warning("Skipping torch.compile: it does not support the int8 dynamically quantized encoder")
+            elif compile_model and hasattr(torch, "compile"):
+                transformer = self.embeddings.client._first_module()
+                transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
+
+        # Warm up the encoder so the first user-visible encode does not pay one-off setup costs
+        self._encode(["warmup"] * 16)
+
+    @staticmethod
+    def _cache_tag_for(quantize: bool, use_onnx: bool) -> bytes:
+        """
+        Get the embedding-cache key personalisation for an encoder variant.
+
+        Cache keys are personalised per variant, since their vectors differ slightly.
+
+        Args:
+            quantize (bool): Whether the PyTorch encoder is quantized to int8.
+            use_onnx (bool): Whether the ONNX Runtime encoder is used.
+
+        Returns:
+            bytes: The blake2b personalisation string.
+        """
+        if use_onnx:
+            return b"onnx"
+        return b"torch-int8" if quantize else b"torch-fp32"
+
+    def _load_sentence_transformer(self, quantize: bool) -> SentenceTransformerEmbeddings:
+        """
+        Load the PyTorch SentenceTransformer encoder.
+
+        Args:
+            quantize (bool): Whether to dynamically quantize the encoder's linear layers to int8.
+
+        Returns:
+            SentenceTransformerEmbeddings: The embeddings model.
+        """
         # Initialize the embeddings model using SentenceTransformerEmbeddings
-        self.embeddings = SentenceTransformerEmbeddings(
+        embeddings = SentenceTransformerEmbeddings(
             model_name="all-MiniLM-L6-v2",  # Pretrained model for embedding generation
-            cache_folder=os.path.join(self.persist_directory, "models")  # Cache folder for the model
+            cache_folder=os.path.join(self.persist_directory, "models"),  # Cache folder for the model
+            model_kwargs={"model_kwargs": {"attn_implementation": "sdpa"}},  # Fused attention kernel
+            encode_kwargs={"normalize_embeddings": True}  # Unit-length query vectors for cosine search
         )
 
+        # Cap the sequence length so long chunks do not inflate padding for a whole batch
+        embeddings.client.max_seq_length = 256
+
+        # Make sure the encoder tokenizes with the fast (Rust) tokenizer
+        if not isinstance(embeddings.client.tokenizer, PreTrainedTokenizerFast):
+            embeddings.client.tokenizer = AutoTokenizer.from_pretrained(
+                "sentence-transformers/all-MiniLM-L6-v2",
+                cache_dir=os.path.join(self.persist_directory, "models"),
+                use_fast=True
+            )
+
+        # Quantize the transformer's linear layers to int8 for faster CPU inference
+        if quantize:
+            transformer = embeddings.client._first_module()
+            transformer.auto_model = torch.quantization.quantize_dynamic(
+                transformer.auto_model,
+                {torch.nn.Linear},
+                dtype=torch.qint8
+            )
+
+        return embeddings
+
     def create_vector_store(self, documents):
         """
         Create a vector store from the provided documents.
@@ -53,7 +189,7 @@ class EmbeddingsManager:
             documents (List[Document]): A list of Document objects to be embedded.
 
         Returns:
-            Chroma: An instance of the Chroma vector store containing the document embeddings.
+            VectorStore: The vector store (Chroma, PGVector or FAISS) containing the document embeddings.
 
         Raises:
             ValueError: If no documents are provided.
@@ -66,12 +202,19 @@ class EmbeddingsManager:
             if not documents:
                 raise ValueError("No documents provided")
 
-            # Create the vector store from the documents
-            vector_store = Chroma.from_documents(
-                documents=documents,            # List of documents to embed
-                embedding=self.embeddings,      # Embeddings model
-                persist_directory=self.persist_directory  # Directory to persist the vector store
-            )
+            texts = [doc.page_content for doc in documents]
+            embeddings = self._encode_cached(texts)
+
+            ids = [str(uuid.uuid4()) for _ in documents]
+            metadatas = [doc.metadata for doc in documents]
+
+            # Insert the precomputed embeddings into the configured backend
+            if self.backend == "pgvector":
+                vector_store = self._build_pgvector(ids, texts, embeddings, metadatas)
+            elif self.backend == "faiss":
+                vector_store = self._build_faiss(ids, texts, embeddings, metadatas)
+            else:
+                vector_store = self._build_chroma(ids, texts, embeddings, metadatas)
 
             logger.info("Vector store created successfully")
             return vector_store
@@ -79,3 +222,180 @@ class EmbeddingsManager:
         except Exception as e:
             logger.error(f"Error creating vector store: {str(e)}")
             raise
+
+    def _build_chroma(self, ids: List[str], texts: List[str], embeddings: np.ndarray, metadatas: List[dict]):
+        """
+        Add precomputed embeddings to the persisted Chroma collection.
+
+        Args:
+            ids (List[str]): The document ids.
+            texts (List[str]): The document texts.
+            embeddings (np.ndarray): The document embeddings.
+            metadatas (List[dict]): The document metadata.
+
+        Returns:
+            Chroma: The Chroma vector store.
+        """
+        # Create an empty vector store and insert the precomputed embeddings directly,
+        # so Chroma does not re-embed the documents in small batches
+        vector_store = Chroma(
+            collection_name=CHROMA_COLLECTION_NAME,     # Collection created with the cosine space
+            embedding_function=self.embeddings,         # Embeddings model (used for queries)
+            persist_directory=self.persist_directory,   # Directory to persist the vector store
+            collection_metadata={"hnsw:space": "cosine"}  # Vectors are normalized, so cosine is a dot product
+        )
+
+        # Insert in large batches, capped at the largest batch Chroma accepts per call
+        batch_size = min(CHROMA_INSERT_BATCH_SIZE, vector_store._client.get_max_batch_size())
+        for i in range(0, len(ids), batch_size):
+            vector_store._collection.add(
+                ids=ids[i:i + batch_size],
+                embeddings=embeddings[i:i + batch_size].tolist(),
+                documents=texts[i:i + batch_size],
+                metadatas=metadatas[i:i + batch_size]
+            )
+        return vector_store
+
+    def _build_pgvector(self, ids: List[str], texts: List[str], embeddings: np.ndarray, metadatas: List[dict]):
+        """
+        Add precomputed embeddings to a PostgreSQL pgvector collection.
+
+        Args:
+            ids (List[str]): The document ids.
+            texts (List[str]): The document texts.
+            embeddings (np.ndarray): The document embeddings.
+            metadatas (List[dict]): The document metadata.
+
+        Returns:
+            PGVector: The pgvector vector store.
+        """
+        # Imported lazily so langchain-postgres is only required for the pgvector backend
+        from langchain_postgres import PGVector
+
+        vector_store = PGVector(
+            embeddings=self.embeddings,
+            connection=self.connection,
+            embedding_length=embeddings.shape[1],
+            use_jsonb=True
+        )
+        vector_store.add_embeddings(
+            texts=texts,
+            embeddings=embeddings.tolist(),
+            metadatas=metadatas,
+            ids=ids
+        )
+        return vector_store
+
+    def _build_faiss(self, ids: List[str], texts: List[str], embeddings: np.ndarray, metadatas: List[dict]):
+        """
+        Build a FAISS HNSW index from precomputed embeddings and save it to disk.
+
+        Args:
+            ids (List[str]): The document ids.
+            texts (List[str]): The document texts.
+            embeddings (np.ndarray): The document embeddings.
+            metadatas (List[dict]): The document metadata.
+
+        Returns:
+            FAISS: The FAISS vector store.
+        """
+        # Imported lazily so faiss is only required for the FAISS backend
+        import faiss
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+        from langchain_community.vectorstores import FAISS
+        from langchain_community.vectorstores.utils import DistanceStrategy
+
+        # Embeddings are normalized, so inner product ranks the same as cosine similarity
+        index = faiss.IndexHNSWFlat(embeddings.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        vector_store = FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={},
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+        )
+        vector_store.add_embeddings(
+            text_embeddings=list(zip(texts, embeddings.tolist())),
+            metadatas=metadatas,
+            ids=ids
+        )
+        vector_store.save_local(os.path.join(self.persist_directory, "faiss"))
+        return vector_store
+
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts, reusing embeddings of previously seen chunks from the on-disk cache.
+
+        Only cache misses are encoded; their embeddings are stored back as float16.
+
+        Args:
+            texts (List[str]): The texts to encode.
+
+        Returns:
+            np.ndarray: The embeddings, in the same order as the input texts.
+        """
+        keys = [
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16, person=self._cache_tag).digest()
+            for text in texts
+        ]
+
+        with closing(sqlite3.connect(self.cache_path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache "
+                "(key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+            )
+
+            # Look up the cached vectors
+            unique_keys = list(dict.fromkeys(keys))
+            cached = {}
+            for i in range(0, len(unique_keys), CACHE_QUERY_BATCH_SIZE):
+                batch = unique_keys[i:i + CACHE_QUERY_BATCH_SIZE]
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                )
+                cached.update((key, np.frombuffer(vector, dtype=np.float16)) for key, vector in rows)
+
+            # Encode each missing chunk once, then store it in the cache
+            misses = {key: text for key, text in zip(keys, texts) if key not in cached}
+            logger.info(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+            if misses:
+                new_vectors = self._encode(list(misses.values())).astype(np.float16)
+                cached.update(zip(misses.keys(), new_vectors))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in zip(misses.keys(), new_vectors)]
+                )
+
+        return np.stack([cached[key] for key in keys]).astype(np.float32)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts in a single batched call, sorted by length to minimise padding.
+
+        Args:
+            texts (List[str]): The texts to encode.
+
+        Returns:
+            np.ndarray: The embeddings, in the same order as the input texts.
+        """
+        # Sort by length so each mini-batch holds texts of similar size (less padding)
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        sorted_texts = [texts[i] for i in order]
+
+        if self.use_onnx:
+            embeddings = self.embeddings.encode(sorted_texts, batch_size=1024)
+        else:
+            embeddings = self.embeddings.client.encode(
+                sorted_texts,
+                batch_size=1024,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+
+        # Round to float16 precision, so fresh and cached embeddings are bit-identical
+        embeddings = embeddings.astype(np.float16).astype(np.float32)
+
+        # Scatter the embeddings back into the original order
+        return embeddings[np.argsort(order)]
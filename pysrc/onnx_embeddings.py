@@ -0,0 +1,125 @@
+# -----------------------------------------
+# Imports
+# -----------------------------------------
+
+from langchain_core.embeddings import Embeddings
+from onnxruntime import GraphOptimizationLevel, SessionOptions
+from optimum.onnxruntime import ORTModelForFeatureExtraction
+from transformers import AutoTokenizer
+import logging
+import numpy as np
+import os
+from typing import List
+
+# -----------------------------------------
+# Logger Setup
+# -----------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------------------
+# OnnxEmbeddings Class Definition
+# -----------------------------------------
+
+class OnnxEmbeddings(Embeddings):
+    """
+    LangChain-compatible embeddings that run a sentence-transformers model through ONNX Runtime.
+
+    Attributes:
+        tokenizer: The fast tokenizer matching the exported model.
+        model: The ONNX Runtime feature-extraction model.
+        max_length (int): The maximum number of tokens per text.
+    """
+
+    def __init__(self, model_name: str, export_directory: str, cache_folder: str, max_length: int = 256):
+        """
+        Load the ONNX model, exporting it from the Hugging Face checkpoint on first use.
+
+        Args:
+            model_name (str): The Hugging Face model id to export.
+            export_directory (str): The directory holding the exported ONNX model.
+            cache_folder (str): The Hugging Face cache folder for the checkpoint downloaded on export.
+            max_length (int): The maximum number of tokens per text.
+        """
+        self.max_length = max_length
+
+        # Enable all graph optimizations (attention/layernorm/gelu fusion) and use every core
+        session_options = SessionOptions()
+        session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+
+        # Export the model only once; later runs load it straight from disk
+        if os.path.exists(os.path.join(export_directory, "model.onnx")):
+            source, export = export_directory, False
+        else:
+            logger.info(f"Exporting {model_name} to ONNX in {export_directory}")
+            source, export = model_name, True
+
+        self.tokenizer = AutoTokenizer.from_pretrained(source, cache_dir=cache_folder, use_fast=True)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            source,
+            export=export,
+            cache_dir=cache_folder,
+            provider="CPUExecutionProvider",
+            session_options=session_options
+        )
+
+        if export:
+            self.model.save_pretrained(export_directory)
+            self.tokenizer.save_pretrained(export_directory)
+
+    def encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Encode texts into mean-pooled, L2-normalized embeddings.
+
+        Args:
+            texts (List[str]): The texts to encode.
+            batch_size (int): The number of texts per forward pass.
+
+        Returns:
+            np.ndarray: A (len(texts), dim) array of embeddings, rounded to float16 precision.
+        """
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+
+            # Mean-pool the token embeddings over the attention mask in a single matmul
+            mask = inputs["attention_mask"].astype(token_embeddings.dtype)
+            summed = np.matmul(mask[:, None, :], token_embeddings)[:, 0, :]
+            pooled = summed / np.clip(mask.sum(axis=1, keepdims=True), 1e-9, None)
+
+            batches.append(pooled / np.linalg.norm(pooled, axis=1, keepdims=True).clip(1e-12))
+
+        # Drop precision bits deterministically, matching the float16 embedding cache
+        return np.concatenate(batches).astype(np.float16).astype(np.float32)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of documents.
+
+        Args:
+            texts (List[str]): The documents to embed.
+
+        Returns:
+            List[List[float]]: One embedding per document.
+        """
+        return self.encode(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a single query.
+
+        Args:
+            text (str): The query to embed.
+
+        Returns:
+            List[float]: The query embedding.
+        """
+        return self.encode([text])[0].tolist()
@@ -3,20 +3,26 @@
 # -----------------------------------------
 
 import os
+import sys
 
 # -----------------------------------------
 # Test Data Creation
 # -----------------------------------------
 
-# Create the 'data' directory if it doesn't exist
-os.makedirs("data", exist_ok=True)
+if __name__ == "__main__":
+    # Create the 'data' directory if it doesn't exist
+    os.makedirs("data", exist_ok=True)
 
-# Define the path to the sample text file
-sample_file_path = os.path.join("data", "sample.txt")
+    # Define the path to the sample text file
+    sample_file_path = os.path.join("data", "sample.txt")
 
-# Write sample content to the text file
-with open(sample_file_path, "w", encoding='utf-8') as f:
-    f.write("""
+    # Skip the write if the sample file already exists
+    if os.path.exists(sample_file_path):
+        sys.exit(0)
+
+    # Write sample content to the text file
+    with open(sample_file_path, "w", encoding='utf-8') as f:
+        f.write("""
 Artificial Intelligence and Machine Learning Overview
 
 AI (Artificial Intelligence) is the simulation of human intelligence by machines.
@@ -1,22 +1,56 @@
 import streamlit as st
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pysrc.document_processor import DocumentProcessor
 from pysrc.embeddings_manager import EmbeddingsManager
 from pysrc.rag_engine import RAGEngine
 import logging
 import os
+import shutil
 import tempfile
+from typing import Callable, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def process_files(files) -> bool:
+@st.cache_resource
+def get_embeddings_manager(persist_dir: str = "database") -> EmbeddingsManager:
+    """
+    Get the EmbeddingsManager, loading the embeddings model only once per server process.
+
+    Args:
+        persist_dir: Directory for the vector store and model cache
+
+    Returns:
+        EmbeddingsManager: The shared embeddings manager
+    """
+    return EmbeddingsManager(persist_dir)
+
+def save_uploaded_file(uploaded_file, data_path: str) -> str:
+    """
+    Write an uploaded file into the data directory.
+
+    Args:
+        uploaded_file: Uploaded file object from Streamlit
+        data_path: Directory to write the file into
+
+    Returns:
+        str: Path of the written file
+    """
+    file_path = os.path.join(data_path, uploaded_file.name)
+    with open(file_path, "wb") as f:
+        # Stream in 1 MiB chunks instead of materializing the whole upload as one bytes object
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, f, length=1 << 20)
+    return file_path
+
+def process_files(files, progress_cb: Optional[Callable[[float], None]] = None) -> bool:
     """
     Process uploaded files and initialize the RAG engine.
 
     Args:
         files: List of uploaded file objects from Streamlit
+        progress_cb: Optional callback receiving the overall progress as a fraction in [0, 1]
 
     Returns:
         bool: True if processing was successful
@@ -27,7 +61,7 @@ def process_files(files) -> bool:
     This function:
     1. Creates a temporary directory for file storage
     2. Saves uploaded files
-    3. Initializes document processing and embedding components
+    3. Initializes document processing and gets the cached embedding components
     4. Creates vector store from processed documents
     5. Initializes RAG engine with the vector store
     """
@@ -36,19 +70,26 @@ def process_files(files) -> bool:
         data_path = os.path.join(temp_dir, "data")
         os.makedirs(data_path, exist_ok=True)
 
-        # Save uploaded files
-        for uploaded_file in files:
-            file_path = os.path.join(data_path, uploaded_file.name)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getvalue())
+        # Save uploaded files concurrently so the disk writes overlap. Files sharing a name
+        # would write to the same path at once, so keep only the last one (as a sequential
+        # save would have left on disk).
+        unique_files = {uploaded_file.name: uploaded_file for uploaded_file in files}.values()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda uploaded_file: save_uploaded_file(uploaded_file, data_path), unique_files))
 
         # Initialize components
         doc_processor = DocumentProcessor(data_path)
-        embeddings_manager = EmbeddingsManager("database")
+        embeddings_manager = get_embeddings_manager("database")
 
-        # Process documents
-        documents = doc_processor.load_and_split_documents()
+        # Process documents; loading covers the first half of the progress bar
+        def on_file_loaded(done: int, total: int):
+            if progress_cb:
+                progress_cb(0.5 * done / total)
+
+        documents = doc_processor.load_and_split_documents(progress_cb=on_file_loaded)
         vector_store = embeddings_manager.create_vector_store(documents)
+        if progress_cb:
+            progress_cb(1.0)
 
         # Initialize RAG engine
         st.session_state.rag_engine = RAGEngine(vector_store)
@@ -84,38 +125,6 @@ if 'doc_stats' not in st.session_state:
 # 4. Tab3 (Settings): Controls for RAG engine parameters
 # 5. Footer: Credits and additional information
 
-def process_files(files) -> bool:
-    """Process uploaded files and initialize RAG engine"""
-    try:
-        temp_dir = tempfile.mkdtemp()
-        data_path = os.path.join(temp_dir, "data")
-        os.makedirs(data_path, exist_ok=True)
-
-        # Save uploaded files
-        for uploaded_file in files:
-            file_path = os.path.join(data_path, uploaded_file.name)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getvalue())
-
-        # Initialize components
-        doc_processor = DocumentProcessor(data_path)
-        embeddings_manager = EmbeddingsManager("database")
-
-        # Process documents
-        documents = doc_processor.load_and_split_documents()
-        vector_store = embeddings_manager.create_vector_store(documents)
-
-        # Initialize RAG engine
-        st.session_state.rag_engine = RAGEngine(vector_store)
-        st.session_state.doc_stats["processed"] = len(files)
-        st.session_state.doc_stats["chunks"] = len(documents)
-
-        return True
-
-    except Exception as e:
-        logger.error(f"Error processing files: {str(e)}")
-        raise
-
 # Sidebar
 with st.sidebar:
     st.title("🤖 RAG with Mistral")
@@ -176,11 +185,7 @@ with tab2:
                 with st.status("Processing documents...") as status:
                     try:
                         progress = st.progress(0)
-                        for idx, _ in enumerate(uploaded_files):
-                            progress.progress((idx + 1) / len(uploaded_files))
-                            time.sleep(0.1)
-
-                        success = process_files(uploaded_files)
+                        success = process_files(uploaded_files, progress_cb=progress.progress)
                         if success:
                             status.update(label="✅ Processing complete!", state="complete")
                             st.success("Documents processed successfully!")
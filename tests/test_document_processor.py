@@ -0,0 +1,89 @@
+from pysrc.document_processor import DocumentProcessor, FastTextSplitter
+from langchain.schema import Document
+
+
+def make_paragraphs(count: int) -> str:
+    return "\n\n".join(
+        f"Paragraph {i} has a first sentence. And a second one, with a comma."
+        for i in range(count)
+    )
+
+
+def test_chunks_respect_chunk_size():
+    splitter = FastTextSplitter(chunk_size=1000, chunk_overlap=200)
+    chunks = splitter.split_text(make_paragraphs(200) + " " + "x" * 2500)
+    assert chunks
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+
+
+def test_chunks_end_on_paragraph_breaks():
+    splitter = FastTextSplitter(chunk_size=1000, chunk_overlap=200)
+    chunks = splitter.split_text(make_paragraphs(40))
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.startswith("Paragraph ")
+        assert chunk.endswith("with a comma.")
+
+
+def test_falls_back_to_sentence_boundaries():
+    text = " ".join(f"Sentence number {i} is here, in one long line." for i in range(100))
+    chunks = FastTextSplitter(chunk_size=300, chunk_overlap=50).split_text(text)
+    assert len(chunks) > 1
+    assert all(chunk.endswith(".") for chunk in chunks)
+
+
+def test_consecutive_chunks_overlap():
+    chunks = FastTextSplitter(chunk_size=1000, chunk_overlap=200).split_text(make_paragraphs(40))
+    for previous, current in zip(chunks, chunks[1:]):
+        first_paragraph = current.split("\n\n")[0]
+        assert first_paragraph in previous
+
+
+def test_hard_cuts_text_without_boundaries():
+    chunks = FastTextSplitter(chunk_size=1000, chunk_overlap=200).split_text("x" * 2500)
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+
+def test_split_documents_copies_metadata():
+    splitter = FastTextSplitter(chunk_size=1000, chunk_overlap=200)
+    docs = splitter.split_documents([Document(page_content=make_paragraphs(40), metadata={"source": "a.txt"})])
+    assert len(docs) > 1
+    assert all(doc.metadata == {"source": "a.txt"} for doc in docs)
+    docs[0].metadata["source"] = "changed"
+    assert docs[1].metadata["source"] == "a.txt"
+
+
+def test_load_and_split_documents(tmp_path):
+    (tmp_path / "a.txt").write_text(make_paragraphs(40), encoding="utf-8")
+    (tmp_path / "empty.txt").write_text("", encoding="utf-8")
+    (tmp_path / "ignored.md").write_text("not a text file", encoding="utf-8")
+
+    documents = DocumentProcessor(str(tmp_path)).load_and_split_documents()
+    assert documents
+    assert {doc.metadata["source"] for doc in documents} == {"a.txt"}
+
+
+def test_line_endings_are_normalized_for_every_read_path(tmp_path, monkeypatch):
+    import pysrc.document_processor as document_processor
+
+    # Shrink the single-read threshold so small test files exercise both read paths
+    monkeypatch.setattr(document_processor, "SMALL_FILE_SIZE", 100)
+
+    processor = DocumentProcessor(str(tmp_path))
+    for name, lines in (("small.txt", 3), ("large.txt", 100)):
+        path = tmp_path / name
+        path.write_bytes("line one\r\nline two\rline three\r\n".encode("utf-8") * lines)
+        assert processor._read_text(str(path)) == "line one\nline two\nline three\n" * lines
+
+
+def test_no_chunk_is_contained_in_the_previous_one():
+    first = " ".join(f"Opening sentence {i} of the first paragraph." for i in range(20))
+    second = " ".join(f"Following sentence {i} of the long second paragraph." for i in range(60))
+    text = first + "\n\n" + second
+    assert 850 < len(first) < 1000
+
+    chunks = FastTextSplitter(chunk_size=1000, chunk_overlap=200).split_text(text)
+    assert chunks[0] == first
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current not in previous
+    assert chunks[-1].endswith("Following sentence 59 of the long second paragraph.")
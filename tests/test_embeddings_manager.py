@@ -0,0 +1,78 @@
+import hashlib
+
+import numpy as np
+
+from pysrc.embeddings_manager import EmbeddingsManager
+
+
+class FakeEncoder:
+    """Deterministic stand-in for the embeddings model that records every encoded text."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32):
+        self.encoded.extend(texts)
+        return np.array([self.vector(text) for text in texts], dtype=np.float32)
+
+    @staticmethod
+    def vector(text):
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+        return np.random.default_rng(seed).standard_normal(8).astype(np.float32)
+
+
+def make_manager(tmp_path, quantize=True):
+    # Bypass __init__ so no real model is loaded; the ONNX branch of _encode calls encode() directly
+    manager = object.__new__(EmbeddingsManager)
+    manager.use_onnx = True
+    manager.embeddings = FakeEncoder()
+    manager.cache_path = str(tmp_path / "emb_cache.db")
+    manager._cache_tag = EmbeddingsManager._cache_tag_for(quantize, use_onnx=False)
+    return manager
+
+
+def expected(texts):
+    return np.array([FakeEncoder.vector(text) for text in texts]).astype(np.float16).astype(np.float32)
+
+
+def test_encode_returns_rows_in_input_order(tmp_path):
+    manager = make_manager(tmp_path)
+    texts = ["a much longer text than the others", "b", "medium text", ""]
+
+    np.testing.assert_array_equal(manager._encode(texts), expected(texts))
+    # Encoding happened in length order
+    assert manager.embeddings.encoded == sorted(texts, key=len)
+
+
+def test_second_call_is_served_from_cache(tmp_path):
+    manager = make_manager(tmp_path)
+    texts = [f"chunk {i} " * (i % 7 + 1) for i in range(2000)]
+
+    first = manager._encode_cached(texts)
+    np.testing.assert_array_equal(first, expected(texts))
+
+    manager.embeddings.encoded.clear()
+    second = manager._encode_cached(texts)
+    assert manager.embeddings.encoded == []
+    assert first.dtype == second.dtype == np.float32
+    assert first.tobytes() == second.tobytes()
+
+
+def test_duplicate_texts_are_encoded_once(tmp_path):
+    manager = make_manager(tmp_path)
+    texts = ["same", "other", "same", "same"]
+
+    result = manager._encode_cached(texts)
+    assert sorted(manager.embeddings.encoded) == ["other", "same"]
+    np.testing.assert_array_equal(result, expected(texts))
+
+
+def test_encoder_variants_do_not_share_cache_entries(tmp_path):
+    texts = ["shared chunk", "another chunk"]
+    quantized = make_manager(tmp_path, quantize=True)
+    full_precision = make_manager(tmp_path, quantize=False)
+
+    quantized._encode_cached(texts)
+    full_precision._encode_cached(texts)
+    assert full_precision.embeddings.encoded == texts
+    assert EmbeddingsManager._cache_tag_for(True, False) != EmbeddingsManager._cache_tag_for(False, False)